@@ -1,10 +1,18 @@
 """Claude Chic - A stylish terminal UI for Claude Code."""
 
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
-from claudechic.app import ChatApp
-from claudechic.theme import CHIC_THEME
-from claudechic.protocols import AgentManagerObserver, AgentObserver, PermissionHandler
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.app import ChatApp
+    from claudechic.theme import CHIC_THEME
+    from claudechic.protocols import (
+        AgentManagerObserver,
+        AgentObserver,
+        PermissionHandler,
+    )
 
 __all__ = [
     "ChatApp",
@@ -13,4 +21,15 @@ __all__ = [
     "AgentObserver",
     "PermissionHandler",
 ]
+
+_EXPORTS = {
+    "ChatApp": "claudechic.app",
+    "CHIC_THEME": "claudechic.theme",
+    "AgentManagerObserver": "claudechic.protocols",
+    "AgentObserver": "claudechic.protocols",
+    "PermissionHandler": "claudechic.protocols",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
+
 __version__ = version("claudechic")
@@ -155,6 +155,8 @@ class Agent:
 
         # Status
         self.status: AgentStatus = AgentStatus.IDLE
+        self._idle_event = asyncio.Event()  # Set while status is IDLE
+        self._idle_event.set()
         self._thinking: bool = False  # Whether this agent is currently thinking
         self._interrupted: bool = False  # Suppress errors after intentional interrupt
 
@@ -868,10 +870,18 @@ Key Rules:
     # Helpers
     # -----------------------------------------------------------------------
 
+    async def wait_idle(self) -> None:
+        """Wait until the agent's status returns to IDLE."""
+        await self._idle_event.wait()
+
     def _set_status(self, status: AgentStatus) -> None:
         """Update status and emit event."""
         if self.status != status:
             self.status = status
+            if status == AgentStatus.IDLE:
+                self._idle_event.set()
+            else:
+                self._idle_event.clear()
             if self.observer:
                 self.observer.on_status_changed(self)
 
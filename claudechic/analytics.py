@@ -1,5 +1,6 @@
 """PostHog analytics for claudechic - fire-and-forget event tracking."""
 
+import asyncio
 import os
 import platform
 import shutil
@@ -22,6 +23,9 @@ POSTHOG_API_KEY = "phc_M0LMkbSaDsaXi5LeYE5A95Kz8hTHgsJ4POlqucehsse"
 # Module-level client for connection reuse (lazy initialized)
 _client: httpx.AsyncClient | None = None
 
+# In-flight sends, referenced until done so they aren't garbage collected
+_pending: set[asyncio.Task] = set()
+
 
 def _get_client() -> httpx.AsyncClient:
     """Get or create the shared HTTP client."""
@@ -55,12 +59,21 @@ def get_terminal_program() -> str:
     return os.environ.get("TERM", "unknown")
 
 
-async def capture(
-    event: str, **properties: str | int | float | bool | list[str]
-) -> None:
+# Environment context that is fixed for the life of the process
+_STATIC_CONTEXT: dict[str, str] = {
+    "claudechic_version": VERSION,
+    "term_program": get_terminal_program(),
+    "os": platform.system(),
+}
+
+
+def capture(event: str, **properties: str | int | float | bool | list[str]) -> None:
     """Capture an analytics event to PostHog.
 
-    Fire-and-forget: failures are silently ignored.
+    Fire-and-forget: the request is sent from a background task on the running
+    event loop and failures are silently ignored. Without a running loop the
+    event is dropped. Use `flush()` before exiting
+    to make sure pending events are delivered.
     Respects analytics opt-out setting.
     """
     if not CONFIG["analytics"]["enabled"]:
@@ -71,12 +84,10 @@ async def capture(
 
     if event == "app_started":
         # Include version and environment context on session start
-        props["claudechic_version"] = VERSION
+        props.update(_STATIC_CONTEXT)
         term_size = shutil.get_terminal_size()  # Falls back to (80, 24)
         props["term_width"] = term_size.columns
         props["term_height"] = term_size.lines
-        props["term_program"] = get_terminal_program()
-        props["os"] = platform.system()
         props["has_uv"] = shutil.which("uv") is not None
         props["has_conda"] = shutil.which("conda") is not None
         props["is_git_repo"] = Path(".git").exists() or Path(".git").is_file()
@@ -84,8 +95,8 @@ async def capture(
 
     if event == "app_installed":
         # Minimal context for install - just version and OS
-        props["claudechic_version"] = VERSION
-        props["os"] = platform.system()
+        props["claudechic_version"] = _STATIC_CONTEXT["claudechic_version"]
+        props["os"] = _STATIC_CONTEXT["os"]
 
     if event == "app_closed":
         # Capture terminal size at close (may have changed during session)
@@ -101,8 +112,25 @@ async def capture(
         "properties": props,
     }
 
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # No event loop (thread or sync path) - drop the event
+    task = loop.create_task(_send(payload))
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+async def _send(payload: dict) -> None:
+    """POST a single event payload to PostHog."""
     try:
         client = _get_client()
         await client.post(f"{POSTHOG_HOST}/capture/", json=payload)
-    except (httpx.HTTPError, httpx.TimeoutException):
+    except Exception:
         pass  # Silent failure - analytics should never impact user experience
+
+
+async def flush() -> None:
+    """Wait for all pending events to be sent (call before exit)."""
+    if _pending:
+        await asyncio.gather(*_pending, return_exceptions=True)
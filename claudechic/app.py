@@ -55,7 +55,7 @@ from claudechic.features.worktree.commands import on_response_complete_finish
 from claudechic.permissions import PermissionRequest, PermissionResponse
 from claudechic.agent import Agent, ImageAttachment, ToolUse
 from claudechic.agent_manager import AgentManager
-from claudechic.analytics import capture
+from claudechic.analytics import capture, flush as flush_analytics
 from claudechic.config import CONFIG, NEW_INSTALL, save as save_config
 from claudechic.enums import AgentStatus, PermissionChoice, ToolName
 from claudechic.mcp import set_app, create_chic_server
@@ -180,6 +180,8 @@ class ChatApp(App):
         # Event queues for testing
         self.interactions: asyncio.Queue[PermissionRequest] = asyncio.Queue()
         self.completions: asyncio.Queue[ResponseComplete] = asyncio.Queue()
+        # Set once the initial agent's SDK connection succeeds
+        self.connected = asyncio.Event()
         # File index for fuzzy file search
         self.file_index: FileIndex | None = None
         # Cached widget references (initialized lazily)
@@ -198,6 +200,8 @@ class ChatApp(App):
         self._shell_process: asyncio.subprocess.Process | None = None
         # Pending shell cancel handlers (widget_id -> callback)
         self._pending_shell_cancels: dict[int, Any] = {}
+        # Worktree names being opened by /worktree (guards double creation)
+        self._worktrees_opening: set[str] = set()
         # Agent-to-UI mappings (Agent has no UI references)
         self._chat_views: dict[str, ChatView] = {}  # agent_id -> ChatView
         self._agent_metadata: dict[
@@ -415,15 +419,10 @@ class ChatApp(App):
     def _set_agent_status(
         self, status: AgentStatus, agent_id: str | None = None
     ) -> None:
-        """Update an agent's status and sidebar display."""
+        """Update an agent's status (on_status_changed refreshes the sidebar)."""
         agent = self._get_agent(agent_id)
-        if not agent:
-            return
-        agent.status = status
-        try:
-            self.agent_section.update_status(agent.id, status)
-        except Exception:
-            pass  # Sidebar not mounted yet
+        if agent:
+            agent._set_status(status)
 
     def show_error(self, message: str, exception: Exception | None = None) -> None:
         """Display an error message in the chat view and log to file.
@@ -646,8 +645,8 @@ class ChatApp(App):
         # Track app start (and install if new user)
         self._app_start_time = time.time()
         if NEW_INSTALL:
-            self.run_worker(capture("app_installed"))
-        self.run_worker(capture("app_started", resumed=bool(self._resume_on_start)))
+            capture("app_installed")
+        capture("app_started", resumed=bool(self._resume_on_start))
 
         # Set up notification callback for log messages (warnings and errors)
         set_log_notify_callback(
@@ -755,15 +754,18 @@ class ChatApp(App):
         try:
             await agent.connect(options, resume=resume)
         except CLIConnectionError as e:
-            await capture(
+            capture(
                 "error_occurred",
                 error_type="CLIConnectionError",
                 error_subtype=_categorize_cli_error(e),
                 context="initial_connect",
             )
+            await flush_analytics()
             self.exit(
                 message=f"Connection failed: {e}\n\nPlease run `claude /login` to authenticate."
             )
+        else:
+            self.connected.set()
 
         # Load history if resuming
         if resume:
@@ -982,9 +984,7 @@ class ChatApp(App):
             return
 
         # Track message sent
-        self.run_worker(
-            capture("message_sent", agent_id=agent.analytics_id if agent else "unknown")
-        )
+        capture("message_sent", agent_id=agent.analytics_id if agent else "unknown")
 
         # If in planSwarm mode, this is the task - spawn agents and send orchestrator prompt
         if agent and agent.permission_mode == "planSwarm":
@@ -1480,7 +1480,8 @@ class ChatApp(App):
 
         # Track app close with session duration
         duration = time.time() - getattr(self, "_app_start_time", time.time())
-        await capture("app_closed", duration_seconds=int(duration), end_reason=reason)
+        capture("app_closed", duration_seconds=int(duration), end_reason=reason)
+        await flush_analytics()
 
         # Suppress SDK stderr noise during exit (stream closed errors on all platforms)
         # Note: Windows transport __del__ exceptions need additional stderr redirect
@@ -1928,13 +1929,11 @@ class ChatApp(App):
             return
         old_model = agent.model or "default"
         agent.model = model
-        self.run_worker(
-            capture(
-                "model_changed",
-                from_model=old_model,
-                to_model=model,
-                agent_id=agent.analytics_id,
-            )
+        capture(
+            "model_changed",
+            from_model=old_model,
+            to_model=model,
+            agent_id=agent.analytics_id,
         )
         self._update_footer_model(model)
         if agent.client:
@@ -2218,12 +2217,10 @@ class ChatApp(App):
             "created_at": time.time(),
             "same_directory": same_directory,
         }
-        self.run_worker(
-            capture(
-                "agent_created",
-                same_directory=same_directory,
-                model=agent.model or "default",
-            )
+        capture(
+            "agent_created",
+            same_directory=same_directory,
+            model=agent.model or "default",
         )
 
         try:
@@ -2336,13 +2333,11 @@ class ChatApp(App):
         metadata = self._agent_metadata.pop(agent_id, {})
         duration = time.time() - metadata.get("created_at", time.time())
         same_directory = metadata.get("same_directory", True)
-        self.run_worker(
-            capture(
-                "agent_closed",
-                duration_seconds=int(duration),
-                same_directory=same_directory,
-                message_count=message_count,
-            )
+        capture(
+            "agent_closed",
+            duration_seconds=int(duration),
+            same_directory=same_directory,
+            message_count=message_count,
         )
 
         # Stop review polling only if the closed agent owned the timer
@@ -2400,26 +2395,22 @@ class ChatApp(App):
                 status_code = 429
             elif "500" in err_str:
                 status_code = 500
-        self.run_worker(
-            capture(
-                "error_occurred",
-                error_type=error_type,
-                context="response",
-                status_code=status_code,
-                agent_id=agent.analytics_id,
-            )
+        capture(
+            "error_occurred",
+            error_type=error_type,
+            context="response",
+            status_code=status_code,
+            agent_id=agent.analytics_id,
         )
 
     def on_connection_lost(self, agent: Agent) -> None:
         """Handle lost SDK connection - reconnect."""
         log.info(f"Connection lost for agent {agent.name}, reconnecting...")
-        self.run_worker(
-            capture(
-                "error_occurred",
-                error_type="ConnectionLost",
-                context="connection_lost",
-                agent_id=agent.analytics_id,
-            )
+        capture(
+            "error_occurred",
+            error_type="ConnectionLost",
+            context="connection_lost",
+            agent_id=agent.analytics_id,
         )
         self.notify("Reconnecting...", timeout=2)
         self._reconnect_after_interrupt(agent)
@@ -2435,7 +2426,7 @@ class ChatApp(App):
             self.notify("Reconnected", timeout=2)
         except Exception as e:
             log.exception("Failed to reconnect after interrupt")
-            await capture(
+            capture(
                 "error_occurred",
                 error_type=type(e).__name__,
                 context="reconnect_failed",
@@ -2588,13 +2579,11 @@ class ChatApp(App):
                 answers = await prompt.wait()
 
             choice = PermissionChoice.ALLOW if answers else PermissionChoice.DENY
-            self.run_worker(
-                capture(
-                    "permission_response",
-                    tool="AskUserQuestion",
-                    choice=choice.value,
-                    agent_id=agent.analytics_id,
-                )
+            capture(
+                "permission_response",
+                tool="AskUserQuestion",
+                choice=choice.value,
+                agent_id=agent.analytics_id,
             )
             if not answers:
                 return PermissionResponse(PermissionChoice.DENY)
@@ -2654,14 +2643,12 @@ class ChatApp(App):
             self.notify(f"{request.tool_name} allowed for this session")
 
         # Track permission prompt response
-        self.run_worker(
-            capture(
-                "permission_response",
-                tool=request.tool_name,
-                choice=result.choice.value,
-                has_alternative=bool(result.alternative_message),
-                agent_id=agent.analytics_id,
-            )
+        capture(
+            "permission_response",
+            tool=request.tool_name,
+            choice=result.choice.value,
+            has_alternative=bool(result.alternative_message),
+            agent_id=agent.analytics_id,
         )
 
         return result
@@ -2694,13 +2681,11 @@ class ChatApp(App):
             choice = await prompt.wait()
 
         # Track the response
-        self.run_worker(
-            capture(
-                "permission_response",
-                tool="ExitPlanMode",
-                choice=choice,
-                agent_id=agent.analytics_id,
-            )
+        capture(
+            "permission_response",
+            tool="ExitPlanMode",
+            choice=choice,
+            agent_id=agent.analytics_id,
         )
 
         if choice == "clear_auto":
@@ -154,12 +154,10 @@ def get_help_commands() -> list[tuple[str, str]]:
 def _track_command(app: "ChatApp", command: str) -> None:
     """Track command usage for analytics."""
     agent = app._agent
-    app.run_worker(
-        capture(
-            "command_used",
-            command=command,
-            agent_id=agent.analytics_id if agent else "unknown",
-        )
+    capture(
+        "command_used",
+        command=command,
+        agent_id=agent.analytics_id if agent else "unknown",
     )
 
 
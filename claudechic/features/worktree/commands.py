@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -68,17 +70,17 @@ def handle_worktree_command(app: "ChatApp", command: str) -> None:
 
     subcommand = parts[1]
     if subcommand == "finish":
-        app.run_worker(capture("worktree_action", action="finish", agent_id=agent_id))
+        capture("worktree_action", action="finish", agent_id=agent_id)
         _handle_finish(app)
     elif subcommand == "cleanup":
-        app.run_worker(capture("worktree_action", action="cleanup", agent_id=agent_id))
+        capture("worktree_action", action="cleanup", agent_id=agent_id)
         branches = parts[2].split() if len(parts) > 2 else None
         _handle_cleanup(app, branches)
     elif subcommand == "discard":
-        app.run_worker(capture("worktree_action", action="discard", agent_id=agent_id))
+        capture("worktree_action", action="discard", agent_id=agent_id)
         _handle_discard(app)
     else:
-        app.run_worker(capture("worktree_action", action="create", agent_id=agent_id))
+        capture("worktree_action", action="create", agent_id=agent_id)
         _switch_or_create_worktree(app, subcommand)
 
 
@@ -315,8 +317,26 @@ async def on_response_complete_finish(app: "ChatApp", agent: "Agent") -> None:
         _run_cleanup(app, agent)
 
 
-def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
-    """Switch to existing worktree agent or create new one."""
+async def _list_worktrees_or_notify(app: "ChatApp") -> list[WorktreeInfo] | None:
+    """List worktrees in a thread; notify and return None if git fails."""
+    try:
+        return await asyncio.to_thread(list_worktrees)
+    except subprocess.CalledProcessError as e:
+        error = os.fsdecode(e.stderr).strip() if e.stderr else str(e)
+        app.notify(f"Failed to list worktrees: {error}", severity="error")
+        return None
+
+
+@work(group="worktree_create", exit_on_error=False)
+async def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
+    """Switch to existing worktree agent or create new one.
+
+    Git calls run in a thread so creating a worktree doesn't block the UI.
+    Not exclusive: cancelling can't stop a `git worktree add` already running
+    in its thread, and would orphan the worktree without creating its agent.
+    Instead, a name already being opened is claimed before the first await
+    so a repeated request can't create a second agent for it.
+    """
     # Check if we already have an agent for this worktree
     for agent in app.agents.values():
         if agent.worktree == feature_name:
@@ -325,22 +345,34 @@ def _switch_or_create_worktree(app: "ChatApp", feature_name: str) -> None:
             app.notify(f"Switched to {feature_name}")
             return
 
-    # Check if worktree exists on disk
-    existing = [wt for wt in list_worktrees() if wt.branch == feature_name]
-    if existing:
-        wt = existing[0]
-        app._create_new_agent(
-            feature_name, wt.path, worktree=feature_name, auto_resume=True
-        )
-    else:
-        # Create new worktree
-        success, message, new_cwd = start_worktree(feature_name)
-        if success and new_cwd:
+    if feature_name in app._worktrees_opening:
+        app.notify(f"Already opening {feature_name}")
+        return
+    app._worktrees_opening.add(feature_name)
+    try:
+        # Check if worktree exists on disk
+        worktrees = await _list_worktrees_or_notify(app)
+        if worktrees is None:
+            return
+        existing = [wt for wt in worktrees if wt.branch == feature_name]
+        if existing:
+            wt = existing[0]
             app._create_new_agent(
-                feature_name, new_cwd, worktree=feature_name, auto_resume=False
+                feature_name, wt.path, worktree=feature_name, auto_resume=True
             )
         else:
-            app.notify(message, severity="error")
+            # Create new worktree
+            success, message, new_cwd = await asyncio.to_thread(
+                start_worktree, feature_name
+            )
+            if success and new_cwd:
+                app._create_new_agent(
+                    feature_name, new_cwd, worktree=feature_name, auto_resume=False
+                )
+            else:
+                app.notify(message, severity="error")
+    finally:
+        app._worktrees_opening.discard(feature_name)
 
 
 def _close_agents_for_branches(app: "ChatApp", branches: list[str]) -> None:
@@ -497,20 +529,31 @@ async def _run_cleanup_prompt(
     app.query_one("#input", ChatInput).focus()
 
 
-def _show_worktree_modal(app: "ChatApp") -> None:
+@work(group="worktree_modal", exclusive=True, exit_on_error=False)
+async def _show_worktree_modal(app: "ChatApp") -> None:
     """Show worktree selection modal."""
-    worktrees = [(str(wt.path), wt.branch) for wt in list_worktrees() if not wt.is_main]
+    listing = await _list_worktrees_or_notify(app)
+    if listing is None:
+        return
+    worktrees = [(str(wt.path), wt.branch) for wt in listing if not wt.is_main]
     prompt = WorktreePrompt(worktrees)
     container = Center(prompt, id="worktree-modal")
     app.mount(container)
-    _wait_for_worktree_selection(app, prompt, container)
+    _wait_for_worktree_selection(app, prompt, container, dict(worktrees))
 
 
 @work(group="worktree", exclusive=True, exit_on_error=False)
 async def _wait_for_worktree_selection(
-    app: "ChatApp", prompt: WorktreePrompt, container: Center
+    app: "ChatApp",
+    prompt: WorktreePrompt,
+    container: Center,
+    branches: dict[str, str],
 ) -> None:
-    """Wait for worktree modal selection and act on it."""
+    """Wait for worktree modal selection and act on it.
+
+    ``branches`` maps each listed worktree path to its branch, from the
+    listing the modal was built with, so no further git call is needed.
+    """
     try:
         result = await prompt.wait()
         container.remove()
@@ -519,9 +562,8 @@ async def _wait_for_worktree_selection(
 
         action, value = result
         if action == "switch":
-            # value is the path; find the branch name from worktrees
-            worktrees = {str(wt.path): wt.branch for wt in list_worktrees()}
-            branch = worktrees.get(value, Path(value).name)
+            # value is the path; find the branch name from the listing
+            branch = branches.get(value, Path(value).name)
             _switch_or_create_worktree(app, branch)
         elif action == "new":
             _switch_or_create_worktree(app, value)
@@ -1,5 +1,6 @@
 """Git worktree management for isolated feature work."""
 
+import os
 import subprocess
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -111,10 +112,9 @@ def get_repo_name() -> str:
     result = subprocess.run(
         ["git", "rev-parse", "--show-toplevel"],
         capture_output=True,
-        text=True,
         check=True,
     )
-    return Path(result.stdout.strip()).name
+    return Path(os.fsdecode(result.stdout).rstrip("\n")).name
 
 
 def _is_main_worktree(worktree_path: Path) -> bool:
@@ -129,10 +129,11 @@ def _is_main_worktree(worktree_path: Path) -> bool:
 
 def list_worktrees() -> list[WorktreeInfo]:
     """List all git worktrees for this repo."""
+    # Porcelain output is mostly paths, so decode once as filenames rather
+    # than through a locale text wrapper
     result = subprocess.run(
         ["git", "worktree", "list", "--porcelain"],
         capture_output=True,
-        text=True,
         check=True,
     )
 
@@ -140,12 +141,13 @@ def list_worktrees() -> list[WorktreeInfo]:
     current_path = None
     current_branch = None
 
-    for line in result.stdout.strip().split("\n"):
-        if line.startswith("worktree "):
-            current_path = Path(line[9:])
-        elif line.startswith("branch refs/heads/"):
-            current_branch = line[18:]
-        elif line == "":
+    for line in os.fsdecode(result.stdout).splitlines():
+        key, _, value = line.partition(" ")
+        if key == "worktree":
+            current_path = Path(value)
+        elif key == "branch" and value.startswith("refs/heads/"):
+            current_branch = value[11:]
+        elif not line:
             if current_path and current_branch:
                 is_main = _is_main_worktree(current_path)
                 worktrees.append(WorktreeInfo(current_path, current_branch, is_main))
@@ -160,21 +162,33 @@ def list_worktrees() -> list[WorktreeInfo]:
     return worktrees
 
 
-def get_main_worktree() -> tuple[Path, str] | None:
-    """Find the main worktree (non-feature) path and its branch."""
-    for wt in list_worktrees():
+def get_main_worktree(
+    worktrees: list[WorktreeInfo] | None = None,
+) -> tuple[Path, str] | None:
+    """Find the main worktree (non-feature) path and its branch.
+
+    Pass an existing ``worktrees`` listing to avoid another git call.
+    """
+    if worktrees is None:
+        worktrees = list_worktrees()
+    for wt in worktrees:
         if wt.is_main:
             return wt.path, wt.branch
     return None
 
 
-def get_parent_branch(branch: str, cwd: Path | None = None) -> str | None:
+def get_parent_branch(
+    branch: str,
+    cwd: Path | None = None,
+    worktrees: list[WorktreeInfo] | None = None,
+) -> str | None:
     """Find the branch that the given branch was forked from.
 
     Returns the branch whose tip is an ancestor of our branch and is closest
     to our branch tip. This handles nested worktrees correctly.
     """
-    worktrees = list_worktrees()
+    if worktrees is None:
+        worktrees = list_worktrees()
     other_branches = [wt.branch for wt in worktrees if wt.branch != branch]
 
     if not other_branches:
@@ -237,13 +251,13 @@ def start_worktree(feature_name: str) -> tuple[bool, str, Path | None]:
             ["git", "worktree", "add", "-b", feature_name, str(worktree_dir), "HEAD"],
             check=True,
             capture_output=True,
-            text=True,
         )
 
         return True, f"Created worktree at {worktree_dir}", worktree_dir
 
     except subprocess.CalledProcessError as e:
-        return False, f"Git error: {e.stderr}", None
+        # Git output here is captured as bytes, like the listing helpers
+        return False, f"Git error: {os.fsdecode(e.stderr)}", None
     except Exception as e:
         return False, f"Error: {e}", None
 
@@ -269,14 +283,14 @@ def get_finish_info(cwd: Path | None = None) -> tuple[bool, str, FinishInfo | No
     if current_wt is None or current_wt.is_main:
         return False, "Not in a feature worktree. Switch to a worktree first.", None
 
-    main_wt = get_main_worktree()
+    main_wt = get_main_worktree(worktrees)
     if main_wt is None:
         return False, "Cannot find main worktree.", None
 
     main_dir = main_wt[0]
 
     # Find parent branch (handles nested worktrees)
-    parent_branch = get_parent_branch(current_wt.branch, cwd=cwd)
+    parent_branch = get_parent_branch(current_wt.branch, cwd=cwd, worktrees=worktrees)
     if parent_branch is None:
         # Fallback to main branch
         parent_branch = main_wt[1]
@@ -633,7 +647,7 @@ def cleanup_worktrees(
         needs_confirmation=True means the branch has changes or is unmerged.
     """
     worktrees = list_worktrees()
-    main_wt = get_main_worktree()
+    main_wt = get_main_worktree(worktrees)
     main_dir = main_wt[0] if main_wt else None
     main_branch = main_wt[1] if main_wt else "main"
 
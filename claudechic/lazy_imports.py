@@ -0,0 +1,58 @@
+"""Lazy re-exports for package ``__init__`` modules (PEP 562).
+
+Packages map each public name to the module that defines it. The module is
+only imported when the name is first accessed, so importing one submodule
+doesn't drag in every sibling (or the whole app via ``claudechic/__init__``).
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str], all_names: Iterable[str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Args:
+        package: The package's ``__name__``.
+        exports: Maps each exported name to the module that defines it.
+        all_names: The package's ``__all__``, which must list exactly the
+            names in ``exports`` (checked here so the two can't drift).
+
+    Raises:
+        ValueError: If ``all_names`` and ``exports`` disagree.
+
+    Example:
+        __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
+    """
+    all_names = set(all_names)
+    if all_names != exports.keys():
+        missing = sorted(all_names - exports.keys())
+        extra = sorted(exports.keys() - all_names)
+        raise ValueError(
+            f"{package}: __all__ and lazy exports differ "
+            f"(missing from exports: {missing}, missing from __all__: {extra})"
+        )
+
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value  # Cache so later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -12,6 +12,7 @@ Exposes tools for Claude to manage agents within claudechic:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 from pathlib import Path
@@ -79,12 +80,10 @@ def _track_mcp_tool(tool_name: str) -> None:
     """Track MCP tool usage for analytics."""
     if _app and _app.agent_mgr:
         active = _app.agent_mgr.active
-        _app.run_worker(
-            capture(
-                "mcp_tool_used",
-                tool=tool_name,
-                agent_id=active.analytics_id if active else "unknown",
-            )
+        capture(
+            "mcp_tool_used",
+            tool=tool_name,
+            agent_id=active.analytics_id if active else "unknown",
         )
 
 
@@ -193,7 +192,7 @@ def _make_spawn_worktree(caller_name: str | None = None):
         prompt = args.get("prompt")
 
         # Create the worktree
-        success, message, wt_path = start_worktree(name)
+        success, message, wt_path = await asyncio.to_thread(start_worktree, name)
         if not success or wt_path is None:
             return _error_response(f"Error creating worktree: {message}")
 
@@ -413,8 +412,6 @@ async def _process_finish_resolution(
 
 async def _do_cleanup(agent: Any, info: Any) -> dict[str, Any]:
     """Attempt cleanup and return appropriate response."""
-    import asyncio
-
     success, warning = await asyncio.to_thread(finish_cleanup, info)
     if success:
         branch = info.branch_name
@@ -26,6 +26,7 @@ from aiohttp import web
 if TYPE_CHECKING:
     from claudechic.app import ChatApp
 
+from claudechic.enums import AgentStatus
 from claudechic.tasks import create_safe_task
 
 log = logging.getLogger(__name__)
@@ -175,20 +176,17 @@ async def handle_wait_idle(request: web.Request) -> web.Response:
     if agent is None:
         return web.json_response({"error": "No active agent"}, status=400)
 
-    from claudechic.enums import AgentStatus
+    # wait_for times out immediately for timeout <= 0, even if already idle
+    if agent.status == AgentStatus.IDLE:
+        return web.json_response({"status": "idle"})
 
     try:
-        loop = asyncio.get_running_loop()
-        start = loop.time()
-        while agent.status != AgentStatus.IDLE:
-            if loop.time() - start > timeout:
-                return web.json_response(
-                    {"error": "Timeout waiting for idle"}, status=408
-                )
-            await asyncio.sleep(0.1)
-        return web.json_response({"status": "idle"})
+        await asyncio.wait_for(agent.wait_idle(), timeout)
+    except asyncio.TimeoutError:
+        return web.json_response({"error": "Timeout waiting for idle"}, status=408)
     except Exception as e:
         return web.json_response({"error": str(e)}, status=500)
+    return web.json_response({"status": "idle"})
 
 
 async def handle_status(request: web.Request) -> web.Response:  # noqa: ARG001
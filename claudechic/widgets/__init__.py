@@ -3,90 +3,95 @@
 Re-exports all widgets from submodules for backward compatibility.
 """
 
-# Base classes
-from claudechic.widgets.base import ToolWidget
-
-# Primitives
-from claudechic.widgets.primitives import (
-    Button,
-    QuietCollapsible,
-    AutoHideScroll,
-    Spinner,
-)
-
-# Content widgets
-from claudechic.widgets.content import (
-    ChatMessage,
-    ChatInput,
-    ThinkingIndicator,
-    ConnectingIndicator,
-    ImageAttachments,
-    ErrorMessage,
-    SystemInfo,
-    ChatAttachment,
-    ToolUseWidget,
-    TaskWidget,
-    AgentToolWidget,
-    AgentListWidget,
-    ShellOutputWidget,
-    PendingShellWidget,
-    EditPlanRequested,
-    DiffWidget,
-    TodoWidget,
-    TodoPanel,
-)
-
-# Input widgets
-from claudechic.widgets.input import TextAreaAutoComplete, HistorySearch
-
-# Layout widgets
-from claudechic.widgets.layout import (
-    ChatView,
-    AgentItem,
-    AgentSection,
-    WorktreeItem,
-    PlanItem,
-    PlanSection,
-    FileItem,
-    FilesSection,
-    SidebarSection,
-    SidebarItem,
-    HamburgerButton,
-    SessionItem,
-    PermissionModeLabel,
-    ModelLabel,
-    StatusFooter,
-    IndicatorWidget,
-    CPUBar,
-    ContextBar,
-    ProcessIndicator,
-    ProcessPanel,
-    ProcessItem,
-    ReviewPanel,
-    ReviewItem,
-)
-
-# Base re-exports (ClickableLabel used by layout widgets)
-from claudechic.widgets.base import ClickableLabel
-
-# Data classes (re-exported for convenience)
-from claudechic.processes import BackgroundProcess
-
-# Report widgets
-from claudechic.widgets.reports import UsageReport, ContextReport
-
-# Modal screens
-from claudechic.widgets.modals import ProfileModal, ProcessModal
-
-# Prompts
-from claudechic.widgets.prompts import (
-    BasePrompt,
-    SelectionPrompt,
-    QuestionPrompt,
-    ModelPrompt,
-    WorktreePrompt,
-    UncommittedChangesPrompt,
-)
+from typing import TYPE_CHECKING
+
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    # Base classes
+    from claudechic.widgets.base import ToolWidget
+
+    # Primitives
+    from claudechic.widgets.primitives import (
+        Button,
+        QuietCollapsible,
+        AutoHideScroll,
+        Spinner,
+    )
+
+    # Content widgets
+    from claudechic.widgets.content import (
+        ChatMessage,
+        ChatInput,
+        ThinkingIndicator,
+        ConnectingIndicator,
+        ImageAttachments,
+        ErrorMessage,
+        SystemInfo,
+        ChatAttachment,
+        ToolUseWidget,
+        TaskWidget,
+        AgentToolWidget,
+        AgentListWidget,
+        ShellOutputWidget,
+        PendingShellWidget,
+        EditPlanRequested,
+        DiffWidget,
+        TodoWidget,
+        TodoPanel,
+    )
+
+    # Input widgets
+    from claudechic.widgets.input import TextAreaAutoComplete, HistorySearch
+
+    # Layout widgets
+    from claudechic.widgets.layout import (
+        ChatView,
+        AgentItem,
+        AgentSection,
+        WorktreeItem,
+        PlanItem,
+        PlanSection,
+        FileItem,
+        FilesSection,
+        SidebarSection,
+        SidebarItem,
+        HamburgerButton,
+        SessionItem,
+        PermissionModeLabel,
+        ModelLabel,
+        StatusFooter,
+        IndicatorWidget,
+        CPUBar,
+        ContextBar,
+        ProcessIndicator,
+        ProcessPanel,
+        ProcessItem,
+        ReviewPanel,
+        ReviewItem,
+    )
+
+    # Base re-exports (ClickableLabel used by layout widgets)
+    from claudechic.widgets.base import ClickableLabel
+
+    # Data classes (re-exported for convenience)
+    from claudechic.processes import BackgroundProcess
+
+    # Report widgets
+    from claudechic.widgets.reports import UsageReport, ContextReport
+
+    # Modal screens
+    from claudechic.widgets.modals import ProfileModal, ProcessModal
+
+    # Prompts
+    from claudechic.widgets.prompts import (
+        BasePrompt,
+        SelectionPrompt,
+        QuestionPrompt,
+        ModelPrompt,
+        WorktreePrompt,
+        UncommittedChangesPrompt,
+    )
 
 __all__ = [
     # Base
@@ -158,3 +163,68 @@ __all__ = [
     "WorktreePrompt",
     "UncommittedChangesPrompt",
 ]
+
+_EXPORTS = {
+    "ToolWidget": "claudechic.widgets.base",
+    "Button": "claudechic.widgets.primitives",
+    "QuietCollapsible": "claudechic.widgets.primitives",
+    "AutoHideScroll": "claudechic.widgets.primitives",
+    "Spinner": "claudechic.widgets.primitives",
+    "ChatMessage": "claudechic.widgets.content",
+    "ChatInput": "claudechic.widgets.content",
+    "ThinkingIndicator": "claudechic.widgets.content",
+    "ConnectingIndicator": "claudechic.widgets.content",
+    "ImageAttachments": "claudechic.widgets.content",
+    "ErrorMessage": "claudechic.widgets.content",
+    "SystemInfo": "claudechic.widgets.content",
+    "ChatAttachment": "claudechic.widgets.content",
+    "ToolUseWidget": "claudechic.widgets.content",
+    "TaskWidget": "claudechic.widgets.content",
+    "AgentToolWidget": "claudechic.widgets.content",
+    "AgentListWidget": "claudechic.widgets.content",
+    "ShellOutputWidget": "claudechic.widgets.content",
+    "PendingShellWidget": "claudechic.widgets.content",
+    "EditPlanRequested": "claudechic.widgets.content",
+    "DiffWidget": "claudechic.widgets.content",
+    "TodoWidget": "claudechic.widgets.content",
+    "TodoPanel": "claudechic.widgets.content",
+    "TextAreaAutoComplete": "claudechic.widgets.input",
+    "HistorySearch": "claudechic.widgets.input",
+    "ChatView": "claudechic.widgets.layout",
+    "AgentItem": "claudechic.widgets.layout",
+    "AgentSection": "claudechic.widgets.layout",
+    "WorktreeItem": "claudechic.widgets.layout",
+    "PlanItem": "claudechic.widgets.layout",
+    "PlanSection": "claudechic.widgets.layout",
+    "FileItem": "claudechic.widgets.layout",
+    "FilesSection": "claudechic.widgets.layout",
+    "SidebarSection": "claudechic.widgets.layout",
+    "SidebarItem": "claudechic.widgets.layout",
+    "HamburgerButton": "claudechic.widgets.layout",
+    "SessionItem": "claudechic.widgets.layout",
+    "PermissionModeLabel": "claudechic.widgets.layout",
+    "ModelLabel": "claudechic.widgets.layout",
+    "StatusFooter": "claudechic.widgets.layout",
+    "IndicatorWidget": "claudechic.widgets.layout",
+    "CPUBar": "claudechic.widgets.layout",
+    "ContextBar": "claudechic.widgets.layout",
+    "ProcessIndicator": "claudechic.widgets.layout",
+    "ProcessPanel": "claudechic.widgets.layout",
+    "ProcessItem": "claudechic.widgets.layout",
+    "ReviewPanel": "claudechic.widgets.layout",
+    "ReviewItem": "claudechic.widgets.layout",
+    "ClickableLabel": "claudechic.widgets.base",
+    "BackgroundProcess": "claudechic.processes",
+    "UsageReport": "claudechic.widgets.reports",
+    "ContextReport": "claudechic.widgets.reports",
+    "ProfileModal": "claudechic.widgets.modals",
+    "ProcessModal": "claudechic.widgets.modals",
+    "BasePrompt": "claudechic.widgets.prompts",
+    "SelectionPrompt": "claudechic.widgets.prompts",
+    "QuestionPrompt": "claudechic.widgets.prompts",
+    "ModelPrompt": "claudechic.widgets.prompts",
+    "WorktreePrompt": "claudechic.widgets.prompts",
+    "UncommittedChangesPrompt": "claudechic.widgets.prompts",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
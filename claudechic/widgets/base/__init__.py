@@ -4,12 +4,25 @@ Note: Mouse cursor styling is now handled via CSS (pointer: pointer, pointer: te
 See Textual 7.4.0+ for native support.
 """
 
-from claudechic.widgets.base.clickable import ClickableLabel
-from claudechic.widgets.base.tool_protocol import ToolWidget
-from claudechic.widgets.base.tool_base import BaseToolWidget
+from typing import TYPE_CHECKING
 
-__all__ = [
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.base.clickable import ClickableLabel
+    from claudechic.widgets.base.tool_protocol import ToolWidget
+    from claudechic.widgets.base.tool_base import BaseToolWidget
+
+__all__ = (
     "ClickableLabel",
     "ToolWidget",
     "BaseToolWidget",
-]
+)
+
+_EXPORTS = {
+    "ClickableLabel": "claudechic.widgets.base.clickable",
+    "ToolWidget": "claudechic.widgets.base.tool_protocol",
+    "BaseToolWidget": "claudechic.widgets.base.tool_base",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
@@ -1,26 +1,31 @@
 """Content display widgets - messages, tools, diffs."""
 
-from claudechic.widgets.content.message import (
-    ChatMessage,
-    ChatInput,
-    ThinkingIndicator,
-    ConnectingIndicator,
-    ImageAttachments,
-    ErrorMessage,
-    SystemInfo,
-    ChatAttachment,
-)
-from claudechic.widgets.content.tools import (
-    ToolUseWidget,
-    TaskWidget,
-    AgentToolWidget,
-    AgentListWidget,
-    ShellOutputWidget,
-    PendingShellWidget,
-    EditPlanRequested,
-)
-from claudechic.widgets.content.diff import DiffWidget
-from claudechic.widgets.content.todo import TodoWidget, TodoPanel, TodoItem
+from typing import TYPE_CHECKING
+
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.content.message import (
+        ChatMessage,
+        ChatInput,
+        ThinkingIndicator,
+        ConnectingIndicator,
+        ImageAttachments,
+        ErrorMessage,
+        SystemInfo,
+        ChatAttachment,
+    )
+    from claudechic.widgets.content.tools import (
+        ToolUseWidget,
+        TaskWidget,
+        AgentToolWidget,
+        AgentListWidget,
+        ShellOutputWidget,
+        PendingShellWidget,
+        EditPlanRequested,
+    )
+    from claudechic.widgets.content.diff import DiffWidget
+    from claudechic.widgets.content.todo import TodoWidget, TodoPanel, TodoItem
 
 __all__ = [
     "ChatMessage",
@@ -43,3 +48,27 @@ __all__ = [
     "TodoPanel",
     "TodoItem",
 ]
+
+_EXPORTS = {
+    "ChatMessage": "claudechic.widgets.content.message",
+    "ChatInput": "claudechic.widgets.content.message",
+    "ThinkingIndicator": "claudechic.widgets.content.message",
+    "ConnectingIndicator": "claudechic.widgets.content.message",
+    "ImageAttachments": "claudechic.widgets.content.message",
+    "ErrorMessage": "claudechic.widgets.content.message",
+    "SystemInfo": "claudechic.widgets.content.message",
+    "ChatAttachment": "claudechic.widgets.content.message",
+    "ToolUseWidget": "claudechic.widgets.content.tools",
+    "TaskWidget": "claudechic.widgets.content.tools",
+    "AgentToolWidget": "claudechic.widgets.content.tools",
+    "AgentListWidget": "claudechic.widgets.content.tools",
+    "ShellOutputWidget": "claudechic.widgets.content.tools",
+    "PendingShellWidget": "claudechic.widgets.content.tools",
+    "EditPlanRequested": "claudechic.widgets.content.tools",
+    "DiffWidget": "claudechic.widgets.content.diff",
+    "TodoWidget": "claudechic.widgets.content.todo",
+    "TodoPanel": "claudechic.widgets.content.todo",
+    "TodoItem": "claudechic.widgets.content.todo",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
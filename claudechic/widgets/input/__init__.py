@@ -1,9 +1,21 @@
 """Input widgets - text areas, autocomplete, search."""
 
-from claudechic.widgets.input.autocomplete import TextAreaAutoComplete
-from claudechic.widgets.input.history_search import HistorySearch
+from typing import TYPE_CHECKING
+
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.input.autocomplete import TextAreaAutoComplete
+    from claudechic.widgets.input.history_search import HistorySearch
 
 __all__ = [
     "TextAreaAutoComplete",
     "HistorySearch",
 ]
+
+_EXPORTS = {
+    "TextAreaAutoComplete": "claudechic.widgets.input.autocomplete",
+    "HistorySearch": "claudechic.widgets.input.history_search",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
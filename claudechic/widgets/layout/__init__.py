@@ -1,40 +1,45 @@
 """Layout widgets - chat view, sidebar, footer."""
 
-from claudechic.widgets.layout.chat_view import ChatView
-from claudechic.widgets.layout.sidebar import (
-    AgentItem,
-    AgentSection,
-    WorktreeItem,
-    PlanItem,
-    PlanSection,
-    FileItem,
-    FilesSection,
-    SidebarSection,
-    SidebarItem,
-    HamburgerButton,
-    SessionItem,
-)
-from claudechic.widgets.layout.footer import (
-    PermissionModeLabel,
-    ModelLabel,
-    StatusFooter,
-)
-from claudechic.widgets.layout.indicators import (
-    IndicatorWidget,
-    CPUBar,
-    ContextBar,
-    ProcessIndicator,
-)
-from claudechic.widgets.layout.processes import (
-    ProcessPanel,
-    ProcessItem,
-)
-from claudechic.widgets.layout.reviews import (
-    ReviewPanel,
-    ReviewItem,
-)
+from typing import TYPE_CHECKING
 
-__all__ = [
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.layout.chat_view import ChatView
+    from claudechic.widgets.layout.sidebar import (
+        AgentItem,
+        AgentSection,
+        WorktreeItem,
+        PlanItem,
+        PlanSection,
+        FileItem,
+        FilesSection,
+        SidebarSection,
+        SidebarItem,
+        HamburgerButton,
+        SessionItem,
+    )
+    from claudechic.widgets.layout.footer import (
+        PermissionModeLabel,
+        ModelLabel,
+        StatusFooter,
+    )
+    from claudechic.widgets.layout.indicators import (
+        IndicatorWidget,
+        CPUBar,
+        ContextBar,
+        ProcessIndicator,
+    )
+    from claudechic.widgets.layout.processes import (
+        ProcessPanel,
+        ProcessItem,
+    )
+    from claudechic.widgets.layout.reviews import (
+        ReviewPanel,
+        ReviewItem,
+    )
+
+__all__ = (
     "ChatView",
     "AgentItem",
     "AgentSection",
@@ -58,4 +63,32 @@ __all__ = [
     "ProcessItem",
     "ReviewPanel",
     "ReviewItem",
-]
+)
+
+_EXPORTS = {
+    "ChatView": "claudechic.widgets.layout.chat_view",
+    "AgentItem": "claudechic.widgets.layout.sidebar",
+    "AgentSection": "claudechic.widgets.layout.sidebar",
+    "WorktreeItem": "claudechic.widgets.layout.sidebar",
+    "PlanItem": "claudechic.widgets.layout.sidebar",
+    "PlanSection": "claudechic.widgets.layout.sidebar",
+    "FileItem": "claudechic.widgets.layout.sidebar",
+    "FilesSection": "claudechic.widgets.layout.sidebar",
+    "SidebarSection": "claudechic.widgets.layout.sidebar",
+    "SidebarItem": "claudechic.widgets.layout.sidebar",
+    "HamburgerButton": "claudechic.widgets.layout.sidebar",
+    "SessionItem": "claudechic.widgets.layout.sidebar",
+    "PermissionModeLabel": "claudechic.widgets.layout.footer",
+    "ModelLabel": "claudechic.widgets.layout.footer",
+    "StatusFooter": "claudechic.widgets.layout.footer",
+    "IndicatorWidget": "claudechic.widgets.layout.indicators",
+    "CPUBar": "claudechic.widgets.layout.indicators",
+    "ContextBar": "claudechic.widgets.layout.indicators",
+    "ProcessIndicator": "claudechic.widgets.layout.indicators",
+    "ProcessPanel": "claudechic.widgets.layout.processes",
+    "ProcessItem": "claudechic.widgets.layout.processes",
+    "ReviewPanel": "claudechic.widgets.layout.reviews",
+    "ReviewItem": "claudechic.widgets.layout.reviews",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
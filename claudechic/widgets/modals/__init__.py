@@ -1,11 +1,24 @@
 """Modal screen widgets."""
 
-from claudechic.widgets.modals.profile import ProfileModal
-from claudechic.widgets.modals.process_modal import ProcessModal
-from claudechic.widgets.modals.process_detail import ProcessDetailModal
+from typing import TYPE_CHECKING
+
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.modals.profile import ProfileModal
+    from claudechic.widgets.modals.process_modal import ProcessModal
+    from claudechic.widgets.modals.process_detail import ProcessDetailModal
 
 __all__ = [
     "ProfileModal",
     "ProcessModal",
     "ProcessDetailModal",
 ]
+
+_EXPORTS = {
+    "ProfileModal": "claudechic.widgets.modals.profile",
+    "ProcessModal": "claudechic.widgets.modals.process_modal",
+    "ProcessDetailModal": "claudechic.widgets.modals.process_detail",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
@@ -1,13 +1,27 @@
 """Primitive building-block widgets."""
 
-from claudechic.widgets.primitives.button import Button
-from claudechic.widgets.primitives.collapsible import QuietCollapsible
-from claudechic.widgets.primitives.scroll import AutoHideScroll
-from claudechic.widgets.primitives.spinner import Spinner
+from typing import TYPE_CHECKING
 
-__all__ = [
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.primitives.button import Button
+    from claudechic.widgets.primitives.collapsible import QuietCollapsible
+    from claudechic.widgets.primitives.scroll import AutoHideScroll
+    from claudechic.widgets.primitives.spinner import Spinner
+
+__all__ = (
     "Button",
     "QuietCollapsible",
     "AutoHideScroll",
     "Spinner",
-]
+)
+
+_EXPORTS = {
+    "Button": "claudechic.widgets.primitives.button",
+    "QuietCollapsible": "claudechic.widgets.primitives.collapsible",
+    "AutoHideScroll": "claudechic.widgets.primitives.scroll",
+    "Spinner": "claudechic.widgets.primitives.spinner",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
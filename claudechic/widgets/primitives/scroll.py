@@ -24,6 +24,7 @@ class AutoHideScroll(VerticalScroll):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._tailing = True
+        self._tail_check_pending = False
 
     def _is_near_bottom(self) -> bool:
         """Check if scroll position is near the bottom."""
@@ -35,9 +36,20 @@ class AutoHideScroll(VerticalScroll):
 
     def _user_scrolled_down(self) -> None:
         """User initiated downward scroll - re-enable tailing if at bottom."""
+        self._tail_check_pending = False
         if self._is_near_bottom():
             self._tailing = True
 
+    def _schedule_tail_check(self) -> None:
+        """Check for bottom after the scroll lands, at most once per refresh.
+
+        Skipped while already tailing, since scrolling down can't disable it.
+        """
+        if self._tailing or self._tail_check_pending:
+            return
+        self._tail_check_pending = True
+        self.call_after_refresh(self._user_scrolled_down)
+
     def action_scroll_up(self) -> None:
         """User scrolled up via keyboard."""
         self._user_scrolled_up()
@@ -47,7 +59,7 @@ class AutoHideScroll(VerticalScroll):
         """User scrolled down via keyboard."""
         super().action_scroll_down()
         # Check after scroll completes
-        self.call_after_refresh(self._user_scrolled_down)
+        self._schedule_tail_check()
 
     def action_page_up(self) -> None:
         """User paged up via keyboard."""
@@ -57,7 +69,7 @@ class AutoHideScroll(VerticalScroll):
     def action_page_down(self) -> None:
         """User paged down via keyboard."""
         super().action_page_down()
-        self.call_after_refresh(self._user_scrolled_down)
+        self._schedule_tail_check()
 
     def _on_mouse_scroll_up(self, event) -> None:
         """User scrolled up via mouse wheel."""
@@ -67,7 +79,7 @@ class AutoHideScroll(VerticalScroll):
     def _on_mouse_scroll_down(self, event) -> None:
         """User scrolled down via mouse wheel."""
         super()._on_mouse_scroll_down(event)
-        self.call_after_refresh(self._user_scrolled_down)
+        self._schedule_tail_check()
 
     def _on_scroll_to(self, message: ScrollTo) -> None:
         """User dragged scrollbar."""
@@ -76,7 +88,7 @@ class AutoHideScroll(VerticalScroll):
                 self._user_scrolled_up()
             else:
                 # Dragging down - check after scroll
-                self.call_after_refresh(self._user_scrolled_down)
+                self._schedule_tail_check()
         super()._on_scroll_to(message)
 
     def scroll_if_tailing(self) -> None:
@@ -1,10 +1,11 @@
 """Selection and question prompts for user interaction."""
 
 import asyncio
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 from textual.app import ComposeResult
+from textual.widget import Widget
 from textual.widgets import Static
 
 
@@ -19,6 +20,8 @@ class BasePrompt(Static):
         self.selected_idx = 0
         self._result_event: asyncio.Event = asyncio.Event()
         self._result_value: Any = None
+        # Option widgets in index order, cached to avoid per-keypress queries
+        self._option_widgets: list[Static] = []
         # Text input mode (for "Other" / "New" options)
         self._in_text_mode = False
         self._text_buffer = ""
@@ -41,12 +44,15 @@ class BasePrompt(Static):
 
     def _update_selection(self) -> None:
         """Update visual selection state."""
-        for i in range(self._total_options()):
-            if opt := self.query_one_optional(f"#{self._get_option_id(i)}", Static):
-                if i == self.selected_idx:
-                    opt.add_class("selected")
-                else:
-                    opt.remove_class("selected")
+        with self.app.batch_update():
+            for i, opt in enumerate(self._option_widgets):
+                opt.set_class(i == self.selected_idx, "selected")
+
+    def _cache_option_widgets(self, widgets: Iterable[Widget]) -> None:
+        """Remember option widgets so selection updates can index directly."""
+        self._option_widgets = [
+            w for w in widgets if isinstance(w, Static) and w.has_class("prompt-option")
+        ]
 
     def _resolve(self, result: Any) -> None:
         """Set result and signal completion."""
@@ -57,6 +63,8 @@ class BasePrompt(Static):
 
     def on_mount(self) -> None:
         """Auto-focus on mount to capture keys immediately (only if visible)."""
+        if not self._option_widgets:
+            self._cache_option_widgets(self.children)
         if not self.has_class("hidden"):
             self.focus()
 
@@ -87,14 +95,14 @@ class BasePrompt(Static):
         self._in_text_mode = True
         text_idx = self._text_option_idx()
         if text_idx is not None:
-            opt = self.query_one(f"#{self._get_option_id(text_idx)}", Static)
+            opt = self._option_widgets[text_idx]
             opt.remove_class("prompt-placeholder")
 
     def _update_text_display(self) -> None:
         """Update the text input display with current buffer."""
         text_idx = self._text_option_idx()
         if text_idx is not None:
-            opt = self.query_one(f"#{self._get_option_id(text_idx)}", Static)
+            opt = self._option_widgets[text_idx]
             opt.update(f"{text_idx + 1}. {self._text_buffer}_")
 
     def _exit_text_mode(self) -> None:
@@ -103,7 +111,7 @@ class BasePrompt(Static):
         self._text_buffer = ""
         text_idx = self._text_option_idx()
         if text_idx is not None:
-            opt = self.query_one(f"#{self._get_option_id(text_idx)}", Static)
+            opt = self._option_widgets[text_idx]
             opt.add_class("prompt-placeholder")
             opt.update(f"{text_idx + 1}. {self._text_option_placeholder()}")
 
@@ -283,45 +291,65 @@ class QuestionPrompt(BasePrompt):
         self.questions = questions
         self.current_q = 0
         self.answers: dict[str, str] = {}
+        self._title_text = ""
+        self._option_texts: list[str] = []
+        self._format_question()
+        # Widgets are reused across questions; see _show_question
+        self._title_widget = Static(classes="prompt-title", markup=False)
+        slots = max(len(q.get("options", [])) for q in questions) + 1  # +1 "Other"
+        self._option_slots = [
+            Static(classes="prompt-option", id=self._get_option_id(i), markup=False)
+            for i in range(slots)
+        ]
 
     def compose(self) -> ComposeResult:
-        yield from self._render_question()
+        self._show_question()
+        yield self._title_widget
+        yield from self._option_slots
+
+    def _format_question(self) -> None:
+        """Precompute title and option text for the current question.
 
-    def _render_question(self):
-        """Yield widgets for current question."""
+        Text only changes when advancing questions, so selection moves
+        never re-format labels.
+        """
         q = self.questions[self.current_q]
-        yield Static(
-            f"[{self.current_q + 1}/{len(self.questions)}] {q['question']}",
-            classes="prompt-title",
-            markup=False,
+        self._title_text = (
+            f"[{self.current_q + 1}/{len(self.questions)}] {q['question']}"
         )
+        self._option_texts = []
         for i, opt in enumerate(q.get("options", [])):
-            classes = (
-                "prompt-option selected" if i == self.selected_idx else "prompt-option"
-            )
             label = opt.get("label", "?")
             desc = opt.get("description", "")
-            text = f"{i + 1}. {label}" + (f" - {desc}" if desc else "")
-            yield Static(text, classes=classes, id=self._get_option_id(i), markup=False)
+            self._option_texts.append(
+                f"{i + 1}. {label}" + (f" - {desc}" if desc else "")
+            )
         # "Other" option
-        other_idx = len(q.get("options", []))
-        classes = "prompt-option prompt-placeholder"
-        if self.selected_idx == other_idx:
-            classes += " selected"
-        yield Static(
-            f"{other_idx + 1}. {self._text_option_placeholder()}",
-            classes=classes,
-            id=self._get_option_id(other_idx),
-            markup=False,
-        )
+        other_idx = len(self._option_texts)
+        self._option_texts.append(f"{other_idx + 1}. {self._text_option_placeholder()}")
+
+    def _show_question(self) -> None:
+        """Fill the title and option slots for the current question.
+
+        Unused slots are hidden rather than removed, so advancing questions
+        only updates text and classes on existing widgets.
+        """
+        self._title_widget.update(self._title_text)
+        count = len(self._option_texts)
+        other_idx = count - 1
+        for i, slot in enumerate(self._option_slots):
+            if i < count:
+                slot.update(self._option_texts[i])
+            slot.set_class(i == other_idx, "prompt-placeholder")
+            slot.set_class(i == self.selected_idx, "selected")
+            slot.display = i < count
+        self._option_widgets = self._option_slots[:count]
 
     def _total_options(self) -> int:
-        q = self.questions[self.current_q]
-        return len(q.get("options", [])) + 1  # +1 for "Other"
+        return len(self._option_texts)  # Includes "Other"
 
     def _text_option_idx(self) -> int:
-        q = self.questions[self.current_q]
-        return len(q.get("options", []))
+        return len(self._option_texts) - 1
 
     def _text_option_placeholder(self) -> str:
         return "Other..."
@@ -340,10 +368,6 @@ class QuestionPrompt(BasePrompt):
     def _submit_text(self, text: str) -> None:
         self._record_answer(text)
 
-    def _get_option_id(self, idx: int) -> str:
-        """Return unique DOM id for option at index (includes question number)."""
-        return f"opt-{self.current_q}-{idx}"
-
     def _record_answer(self, answer: str) -> None:
         """Record answer and advance to next question or finish."""
         q = self.questions[self.current_q]
@@ -354,14 +378,16 @@ class QuestionPrompt(BasePrompt):
             self.selected_idx = 0
             self._in_text_mode = False
             self._text_buffer = ""
-            # Remove old children and mount new question
-            for child in list(self.children):
-                child.remove()
-            for w in self._render_question():
-                self.mount(w)
+            self._format_question()
+            self._update_display()
         else:
             self._resolve(self.answers)
 
+    def _update_display(self) -> None:
+        """Show the current question in the existing widgets in one update."""
+        with self.app.batch_update():
+            self._show_question()
+
     def cancel(self) -> None:
         self.answers = {}
         self._resolve({})
@@ -1,10 +1,23 @@
 """Report widgets - in-page display components."""
 
-from claudechic.widgets.reports.context import ContextReport
-from claudechic.widgets.reports.usage import UsageReport, UsageBar
+from typing import TYPE_CHECKING
 
-__all__ = [
+from claudechic.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from claudechic.widgets.reports.context import ContextReport
+    from claudechic.widgets.reports.usage import UsageReport, UsageBar
+
+__all__ = (
     "ContextReport",
     "UsageReport",
     "UsageBar",
-]
+)
+
+_EXPORTS = {
+    "ContextReport": "claudechic.widgets.reports.context",
+    "UsageReport": "claudechic.widgets.reports.usage",
+    "UsageBar": "claudechic.widgets.reports.usage",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS, __all__)
@@ -3,20 +3,35 @@
 from __future__ import annotations
 
 import json
+from types import MappingProxyType
 from typing import Any
 
 import pytest
 from contextlib import ExitStack
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import claudechic.agent as _cagent
+import claudechic.analytics as _canalytics
+import claudechic.app as _capp
 from claudechic.features.roborev.models import ReviewJob
+from claudechic.file_index import FileIndex
 from claudechic.widgets.layout.reviews import ReviewItem
 
 
-async def empty_async_gen():
-    """Empty async generator for mocking receive_response."""
-    return
-    yield  # noqa: unreachable - makes this an async generator
+class _EmptyAsyncIter:
+    """Stateless, always-exhausted async iterator for mocking receive_response."""
+
+    def __aiter__(self) -> _EmptyAsyncIter:
+        return self
+
+    async def __anext__(self) -> Any:
+        raise StopAsyncIteration
+
+
+_EMPTY_ASYNC_ITER = _EmptyAsyncIter()
+
+# Shared by every mock client, so read-only: mutations can't leak between tests
+_EMPTY_SERVER_INFO = MappingProxyType({"commands": (), "models": ()})
 
 
 async def wait_for_workers(app):
@@ -27,22 +42,40 @@ async def wait_for_workers(app):
 async def submit_command(app, pilot, command: str):
     """Submit a command, handling autocomplete properly.
 
-    When setting input text directly, autocomplete may activate.
-    This helper hides it before submitting to ensure the command goes through.
+    When setting input text directly, autocomplete may activate (triggered
+    by / or @). Suppressing it first, as history navigation does, keeps the
+    text change, submit, and a single pause in one round trip.
     """
-    from claudechic.widgets import ChatInput
-
-    input_widget = app.query_one("#input", ChatInput)
+    input_widget = app.chat_input  # Cached by ChatApp, no DOM query
+    if input_widget._autocomplete:
+        input_widget._autocomplete.suppress()
     input_widget.text = command
+    input_widget.action_submit()
     await pilot.pause()
 
-    # Hide autocomplete if it's showing (triggered by / or @)
-    if input_widget._autocomplete and input_widget._autocomplete.display:
-        input_widget._autocomplete.action_hide()
-        await pilot.pause()
 
-    input_widget.action_submit()
-    await pilot.pause()
+def _build_mock_client() -> MagicMock:
+    """Build a fresh SDK client mock for one ``mock_sdk`` test."""
+    mock_client = MagicMock()
+    mock_client.connect = AsyncMock()
+    mock_client.query = AsyncMock()
+    mock_client.interrupt = AsyncMock()
+    mock_client.get_server_info = AsyncMock(return_value=_EMPTY_SERVER_INFO)
+    mock_client.set_permission_mode = AsyncMock()
+    mock_client.receive_response = lambda: _EMPTY_ASYNC_ITER
+    mock_client._transport = None  # For get_claude_pid_from_client
+    return mock_client
+
+
+@pytest.fixture(autouse=True)
+def _disable_analytics():
+    """Keep every test from sending real PostHog events.
+
+    capture() schedules its own send task, so any code path that reports an
+    event would otherwise POST (and leak an httpx AsyncClient) under test.
+    """
+    with patch.dict(_canalytics.CONFIG, {"analytics": {"enabled": False}}):
+        yield
 
 
 @pytest.fixture
@@ -51,42 +84,30 @@ def mock_sdk():
 
     Patches both app.py and agent.py imports since agents create their own clients.
     Also patches FileIndex to avoid subprocess transport leaks during test cleanup.
-    Disables analytics to avoid httpx connection leaks.
     """
-    mock_client = MagicMock()
-    mock_client.connect = AsyncMock()
-    mock_client.query = AsyncMock()
-    mock_client.interrupt = AsyncMock()
-    mock_client.get_server_info = AsyncMock(return_value={"commands": [], "models": []})
-    mock_client.set_permission_mode = AsyncMock()
-    mock_client.receive_response = lambda: empty_async_gen()
-    mock_client._transport = None  # For get_claude_pid_from_client
+    # Built per test so attributes a test assigns can't leak into the next
+    mock_client = _build_mock_client()
 
     # Mock FileIndex to avoid git subprocess transport leaks
     # The subprocess transports try to close after the event loop is closed
-    from claudechic.file_index import FileIndex
-
     mock_file_index = MagicMock(spec=FileIndex)
     mock_file_index.refresh = AsyncMock()
     mock_file_index.files = []
 
     # Use ExitStack to avoid deep nesting
     with ExitStack() as stack:
-        # Disable analytics to avoid httpx AsyncClient connection leaks
-        stack.enter_context(
-            patch.dict("claudechic.analytics.CONFIG", {"analytics": {"enabled": False}})
-        )
+        # Module objects rather than dotted strings: no target import per test
         stack.enter_context(
-            patch("claudechic.app.ClaudeSDKClient", return_value=mock_client)
+            patch.object(_capp, "ClaudeSDKClient", return_value=mock_client)
         )
         stack.enter_context(
-            patch("claudechic.agent.ClaudeSDKClient", return_value=mock_client)
+            patch.object(_cagent, "ClaudeSDKClient", return_value=mock_client)
         )
         stack.enter_context(
-            patch("claudechic.agent.FileIndex", return_value=mock_file_index)
+            patch.object(_cagent, "FileIndex", return_value=mock_file_index)
         )
         stack.enter_context(
-            patch("claudechic.app.FileIndex", return_value=mock_file_index)
+            patch.object(_capp, "FileIndex", return_value=mock_file_index)
         )
         yield mock_client
 
@@ -0,0 +1,75 @@
+"""Tests for fire-and-forget analytics capture."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from claudechic import analytics
+
+ENABLED = {"analytics": {"enabled": True, "id": "test-user"}}
+
+
+@pytest.mark.asyncio
+async def test_capture_disabled_schedules_nothing():
+    """Opted-out capture doesn't create a send task."""
+    with patch.object(analytics, "_send", new=AsyncMock()) as send:
+        analytics.capture("app_started")
+        await analytics.flush()
+    send.assert_not_called()
+    assert not analytics._pending
+
+
+@pytest.mark.asyncio
+async def test_capture_tracks_task_until_flushed():
+    """capture() returns immediately; flush() waits for the send."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_send(payload: dict) -> None:
+        started.set()
+        await release.wait()
+
+    with (
+        patch.dict(analytics.CONFIG, ENABLED),
+        patch.object(analytics, "_send", new=AsyncMock(side_effect=slow_send)) as send,
+    ):
+        analytics.capture("command_used", command="clear")
+        assert len(analytics._pending) == 1
+
+        await started.wait()
+        release.set()
+        await analytics.flush()
+
+    payload = send.await_args.args[0]
+    assert payload["event"] == "command_used"
+    assert payload["distinct_id"] == "test-user"
+    assert payload["properties"]["command"] == "clear"
+    assert payload["properties"]["$session_id"] == analytics.SESSION_ID
+    await asyncio.sleep(0)  # Let done callbacks run
+    assert not analytics._pending
+
+
+def test_capture_without_running_loop_is_dropped():
+    """capture() from sync code with no event loop neither raises nor sends."""
+    with (
+        patch.dict(analytics.CONFIG, ENABLED),
+        patch.object(analytics, "_send") as send,
+    ):
+        analytics.capture("app_installed")
+    send.assert_not_called()
+    assert not analytics._pending
+
+
+@pytest.mark.asyncio
+async def test_send_swallows_unexpected_errors():
+    """Any send failure is silent, not an unretrieved task exception."""
+    with patch.object(analytics, "_get_client", side_effect=RuntimeError("boom")):
+        await analytics._send({"event": "app_started"})
+
+
+@pytest.mark.asyncio
+async def test_flush_with_nothing_pending():
+    """flush() is a no-op when no events are in flight."""
+    assert not analytics._pending
+    await analytics.flush()
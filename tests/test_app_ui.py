@@ -1,5 +1,7 @@
 """App-level UI tests without SDK dependency."""
 
+import asyncio
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -33,6 +35,16 @@ async def test_app_mounts_basic_widgets(mock_sdk):
         assert app.query_one(StatusFooter)
 
 
+@pytest.mark.asyncio
+async def test_initial_connect_sets_connected(mock_sdk):
+    """The connected event fires once the initial agent's SDK connects."""
+    app = ChatApp()
+    async with app.run_test():
+        await asyncio.wait_for(app.connected.wait(), timeout=10)
+        assert app._agent is not None
+        assert app._agent.client is mock_sdk
+
+
 @pytest.mark.asyncio
 async def test_permission_mode_cycle(mock_sdk):
     """Shift+Tab cycles permission mode: default -> acceptEdits -> plan -> default."""
@@ -244,8 +256,6 @@ async def test_double_ctrl_c_quits(mock_sdk):
 
         # Second quick Ctrl+C would exit (but we can't test actual exit easily)
         # Just verify the mechanism exists
-        import time
-
         assert time.time() - app._last_quit_time < 2.0
 
 
@@ -0,0 +1,65 @@
+"""Tests for lazy package re-exports."""
+
+import importlib
+import sys
+import types
+
+import pytest
+
+from claudechic.lazy_imports import lazy_exports
+
+LAZY_PACKAGES = [
+    "claudechic",
+    "claudechic.widgets",
+    "claudechic.widgets.base",
+    "claudechic.widgets.content",
+    "claudechic.widgets.input",
+    "claudechic.widgets.layout",
+    "claudechic.widgets.modals",
+    "claudechic.widgets.primitives",
+    "claudechic.widgets.reports",
+]
+
+
+@pytest.fixture
+def fake_package(monkeypatch):
+    """A throwaway module that lazily re-exports PurePath from pathlib."""
+    module = types.ModuleType("fake_lazy_pkg")
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    module.__getattr__, module.__dir__ = lazy_exports(
+        module.__name__, {"PurePath": "pathlib"}, ["PurePath"]
+    )
+    return module
+
+
+def test_unknown_name_raises_attribute_error(fake_package):
+    """Names outside the export table behave like missing attributes."""
+    with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+        _ = fake_package.Nope
+    assert not hasattr(fake_package, "Nope")
+
+
+def test_loaded_value_is_cached(fake_package):
+    """The first access stores the value so later lookups skip __getattr__."""
+    import pathlib
+
+    assert "PurePath" not in vars(fake_package)
+    assert fake_package.PurePath is pathlib.PurePath
+    assert vars(fake_package)["PurePath"] is pathlib.PurePath
+    assert "PurePath" in dir(fake_package)
+
+
+def test_mismatched_all_is_rejected():
+    """__all__ and the export table must list the same names."""
+    with pytest.raises(ValueError, match="Missing"):
+        lazy_exports(__name__, {"Present": "pathlib"}, ["Present", "Missing"])
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_star_import_resolves_every_name(package):
+    """`from pkg import *` loads every name listed in __all__."""
+    namespace: dict = {}
+    exec(f"from {package} import *", namespace)  # noqa: S102 - star import
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert namespace[name] is getattr(module, name)
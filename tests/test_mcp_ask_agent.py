@@ -46,10 +46,6 @@ class MockApp:
     def __init__(self):
         self.agent_mgr = MockAgentManager()
 
-    def run_worker(self, coro):
-        """Mock run_worker - just ignore the coroutine."""
-        pass
-
 
 @pytest.fixture
 def mock_app():
@@ -0,0 +1,70 @@
+"""Tests for the remote control HTTP handlers."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+from claudechic import remote
+from claudechic.agent import Agent
+from claudechic.enums import AgentStatus
+
+
+@pytest.mark.asyncio
+async def test_wait_idle_blocks_while_busy():
+    """wait_idle() returns immediately when idle and wakes on IDLE."""
+    agent = Agent(name="test", cwd=Path.cwd())
+    await asyncio.wait_for(agent.wait_idle(), timeout=1)
+
+    agent._set_status(AgentStatus.BUSY)
+    waiter = asyncio.create_task(agent.wait_idle())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    agent._set_status(AgentStatus.IDLE)
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_handle_wait_idle_returns_when_idle():
+    """The endpoint responds once the active agent goes idle."""
+    agent = Agent(name="test", cwd=Path.cwd())
+    agent._set_status(AgentStatus.BUSY)
+    request = make_mocked_request("GET", "/wait_idle?timeout=5")
+
+    with patch.object(remote, "_app", SimpleNamespace(_agent=agent)):
+        handler = asyncio.create_task(remote.handle_wait_idle(request))
+        await asyncio.sleep(0)
+        assert not handler.done()
+        agent._set_status(AgentStatus.IDLE)
+        response = await asyncio.wait_for(handler, timeout=1)
+
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+async def test_handle_wait_idle_times_out():
+    """The endpoint returns 408 if the agent stays busy past the timeout."""
+    agent = Agent(name="test", cwd=Path.cwd())
+    agent._set_status(AgentStatus.BUSY)
+    request = make_mocked_request("GET", "/wait_idle?timeout=0.01")
+
+    with patch.object(remote, "_app", SimpleNamespace(_agent=agent)):
+        response = await remote.handle_wait_idle(request)
+
+    assert response.status == 408
+
+
+@pytest.mark.asyncio
+async def test_handle_wait_idle_zero_timeout_when_idle():
+    """An already-idle agent answers even with timeout=0."""
+    agent = Agent(name="test", cwd=Path.cwd())
+    request = make_mocked_request("GET", "/wait_idle?timeout=0")
+
+    with patch.object(remote, "_app", SimpleNamespace(_agent=agent)):
+        response = await remote.handle_wait_idle(request)
+
+    assert response.status == 200
@@ -257,12 +257,51 @@ async def test_question_prompt_multi_question():
         assert prompt.current_q == 1
         assert prompt.answers == {"Q1?": "Yes"}
 
+        # Title and options now show the second question
+        await pilot.pause()
+        assert "Q2?" in str(prompt.query_one(".prompt-title", Static).render())
+
         await pilot.press("2")  # Select "Blue"
 
         # Prompt should have resolved after second answer
         assert prompt.answers == {"Q1?": "Yes", "Q2?": "Blue"}
 
 
+@pytest.mark.asyncio
+async def test_question_prompt_reuses_option_widgets():
+    """Advancing questions updates existing widgets, hiding unused slots."""
+    questions = [
+        {
+            "question": "Q1?",
+            "options": [{"label": "A"}, {"label": "B"}, {"label": "C"}],
+        },
+        {"question": "Q2?", "options": [{"label": "Only", "description": "one"}]},
+    ]
+
+    app = WidgetTestApp(lambda: QuestionPrompt(questions))
+    async with app.run_test() as pilot:
+        prompt = app.query_one(QuestionPrompt)
+        slots = list(prompt.query(".prompt-option").results(Static))
+        assert len(slots) == 4  # 3 options + "Other"
+
+        await pilot.press("down", "1")
+        assert prompt.current_q == 1
+        await pilot.pause()
+
+        # Same widgets, with only "Only" and "Other" shown
+        assert list(prompt.query(".prompt-option").results(Static)) == slots
+        visible = [w for w in slots if w.display]
+        assert [str(w.render()) for w in visible] == ["1. Only - one", "2. Other..."]
+        assert visible[0].has_class("selected")
+        assert visible[1].has_class("prompt-placeholder")
+        assert not slots[3].has_class("prompt-placeholder")
+
+        # Selection moves within the visible options only
+        await pilot.press("down", "down")
+        assert prompt.selected_idx == 0
+        assert visible[0].has_class("selected")
+
+
 @pytest.mark.asyncio
 async def test_agent_section_add_remove():
     """Can add and remove agents."""
@@ -751,3 +790,45 @@ async def test_tool_use_widget_edit_lazy_diff():
         # DiffWidget should now exist
         diffs = widget.query(DiffWidget)
         assert len(diffs) == 1
+
+
+@pytest.mark.asyncio
+async def test_auto_hide_scroll_tailing():
+    """Scrolling up stops tailing; scrolling back to bottom resumes it."""
+    from unittest.mock import patch
+
+    from claudechic.widgets.primitives.scroll import AutoHideScroll
+
+    class TestApp(App):
+        def compose(self):
+            with AutoHideScroll():
+                for i in range(200):
+                    yield Static(f"line {i}")
+
+    app = TestApp()
+    async with app.run_test() as pilot:
+        scroll = app.query_one(AutoHideScroll)
+        scroll.scroll_home(animate=False)
+        scroll.action_scroll_up()
+        assert not scroll._tailing
+
+        # Repeated scroll-down ticks before a refresh share one tail check
+        with patch.object(scroll, "call_after_refresh") as after_refresh:
+            scroll.action_scroll_down()
+            scroll.action_scroll_down()
+        # Textual's own scroll also defers via call_after_refresh; count ours
+        tail_checks = [
+            c
+            for c in after_refresh.call_args_list
+            if c.args == (scroll._user_scrolled_down,)
+        ]
+        assert len(tail_checks) == 1
+        scroll._tail_check_pending = False  # The patched check never ran
+
+        # Scrolling down at the bottom re-enables tailing after the refresh
+        scroll.scroll_end(animate=False)
+        scroll.action_scroll_down()
+        scroll.action_scroll_down()
+        await pilot.pause()
+        assert scroll._tailing
+        assert not scroll._tail_check_pending
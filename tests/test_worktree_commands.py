@@ -0,0 +1,73 @@
+"""Tests for /worktree command workers."""
+
+import subprocess
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from textual.app import App
+
+from claudechic.features.worktree import commands
+from claudechic.features.worktree.git import WorktreeInfo
+
+
+class WorktreeApp(App):
+    """Just the ChatApp surface _switch_or_create_worktree touches."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.agents: dict = {}
+        self.agent_mgr = None
+        self._worktrees_opening: set[str] = set()
+        self._create_new_agent = MagicMock()
+        self.notifications: list[tuple[str, str]] = []
+
+    def notify(self, message, *, severity="information", **kwargs) -> None:
+        self.notifications.append((message, severity))
+
+
+@pytest.mark.asyncio
+async def test_repeated_open_creates_one_agent():
+    """A second request while git is still listing doesn't add a second agent."""
+    release = threading.Event()
+    listing = [WorktreeInfo(Path("/repo-foo"), "foo", False)]
+
+    def slow_list_worktrees() -> list[WorktreeInfo]:
+        release.wait(timeout=5)
+        return listing
+
+    app = WorktreeApp()
+    async with app.run_test() as pilot:
+        with patch.object(commands, "list_worktrees", slow_list_worktrees):
+            commands._switch_or_create_worktree(app, "foo")
+            await pilot.pause()
+            commands._switch_or_create_worktree(app, "foo")
+            await pilot.pause()
+            release.set()
+            await app.workers.wait_for_complete()
+
+        app._create_new_agent.assert_called_once_with(
+            "foo", Path("/repo-foo"), worktree="foo", auto_resume=True
+        )
+        assert ("Already opening foo", "information") in app.notifications
+        assert not app._worktrees_opening
+
+
+@pytest.mark.asyncio
+async def test_listing_failure_is_notified():
+    """A failing `git worktree list` is reported instead of swallowed."""
+    error = subprocess.CalledProcessError(
+        128, ["git", "worktree", "list"], stderr=b"fatal: not a git repository\n"
+    )
+    app = WorktreeApp()
+    async with app.run_test():
+        with patch.object(commands, "list_worktrees", side_effect=error):
+            commands._switch_or_create_worktree(app, "foo")
+            await app.workers.wait_for_complete()
+
+        app._create_new_agent.assert_not_called()
+        assert app.notifications == [
+            ("Failed to list worktrees: fatal: not a git repository", "error")
+        ]
+        assert not app._worktrees_opening
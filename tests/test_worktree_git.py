@@ -0,0 +1,60 @@
+"""Tests for worktree git helpers."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from claudechic.features.worktree import git
+from claudechic.features.worktree.git import list_worktrees, start_worktree
+
+
+def _porcelain(text: str) -> MagicMock:
+    """Fake `git worktree list --porcelain` result with bytes stdout."""
+    return MagicMock(stdout=os.fsencode(text))
+
+
+def test_list_worktrees_parses_porcelain_bytes():
+    """Branch entries are listed; detached entries are skipped."""
+    output = (
+        "worktree /repo/main\n"
+        "HEAD 1111111\n"
+        "branch refs/heads/main\n"
+        "\n"
+        "worktree /repo/detached\n"
+        "HEAD 2222222\n"
+        "detached\n"
+        "\n"
+        "worktree /repo/café-feature\n"
+        "HEAD 3333333\n"
+        "branch refs/heads/café\n"
+    )  # No trailing blank line after the last entry
+    with (
+        patch("subprocess.run", return_value=_porcelain(output)),
+        patch.object(git, "_is_main_worktree", side_effect=lambda p: p.name == "main"),
+    ):
+        worktrees = list_worktrees()
+
+    assert [(wt.path, wt.branch, wt.is_main) for wt in worktrees] == [
+        (Path("/repo/main"), "main", True),
+        (Path("/repo/café-feature"), "café", False),
+    ]
+
+
+def test_start_worktree_decodes_git_error(tmp_path: Path):
+    """A failed `git worktree add` reports git's stderr as text."""
+    error = subprocess.CalledProcessError(
+        128, ["git", "worktree", "add"], stderr=b"fatal: invalid reference\n"
+    )
+    with (
+        patch.object(git, "get_repo_name", return_value="repo"),
+        patch.object(
+            git, "get_main_worktree", return_value=(tmp_path / "repo", "main")
+        ),
+        patch("subprocess.run", side_effect=error),
+    ):
+        success, message, path = start_worktree("feature")
+
+    assert not success
+    assert path is None
+    assert message == "Git error: fatal: invalid reference\n"